@@ -1,5 +1,10 @@
 import requests
 from decimal import Decimal
+from threading import Lock
+from typing import Any, Mapping
+
+import orjson
+from cachetools import TTLCache
 
 from config import Config
 from common import PriceInfo, TokenOverview
@@ -10,40 +15,59 @@ from custom_exceptions import (
     InvalidTokens,
     NO_LIQUDITY,
 )
-from utils.helpers import is_solana_address
+from utils.helpers import (
+    chunked,
+    fan_out,
+    freeze,
+    is_solana_address,
+    partition_cached,
+    validate_solana_addresses,
+)
+from utils.http import build_session
+from vars.constants import REQUEST_TIMEOUT
+
+# Maximum number of addresses accepted by a single multi_price call
+_BIRDEYE_MAX = 100
 
 
 class BirdEyeClient:
     """
     Handler class to assist with all calls to BirdEye API
+
+    Use get_birdeye_client() to share one instance per process, constructing
+    the client directly creates a new connection pool every time
     """
 
-    @property
-    def _headers(self):
-        return {
-            "accept": "application/json",
-            "x-chain": "solana",
-            "X-API-KEY": Config.BIRD_EYE_TOKEN,
-        }
+    _MULTI_PRICE_URL = f"{Config.BIRD_EYE_URL}/multi_price"
+    _TOKEN_OVERVIEW_URL = f"{Config.BIRD_EYE_URL}/token_overview"
+
+    def __init__(self):
+        if not Config.BIRD_EYE_TOKEN:
+            raise RuntimeError("BIRD_EYE_TOKEN is not set, add it to your .env file")
+
+        # Keep one pooled session, with the fixed auth headers set on it once
+        self._session = build_session(
+            {"x-chain": "solana", "X-API-KEY": Config.BIRD_EYE_TOKEN}
+        )
+        self._dispatch = {"GET": self._session.get, "POST": self._session.post}
+
+        self._cache_lock = Lock()
+        self._price_cache = TTLCache(maxsize=4096, ttl=Config.PRICE_TTL)
+        self._overview_cache = TTLCache(maxsize=4096, ttl=Config.PRICE_TTL)
 
     def _make_api_call(
         self, method: str, query_url: str, *args, **kwargs
     ) -> requests.Response:
-        match method.upper():
-            case "GET":
-                query_method = requests.get
-            case "POST":
-                query_method = requests.post
-            case _:
-                raise ValueError(
-                    f'Unrecognised method "{method}" passed for query - {query_url}'
-                )
-        resp = query_method(query_url, *args, headers=self._headers, **kwargs)
+        query_method = self._dispatch.get(method)
+        if query_method is None:
+            raise ValueError(
+                f'Unrecognised method "{method}" passed for query - {query_url}'
+            )
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        resp = query_method(query_url, *args, **kwargs)
         return resp
 
-    def fetch_prices(
-        self, token_addresses: list[str]
-    ) -> dict[str, PriceInfo[Decimal, Decimal]]:
+    def fetch_prices(self, token_addresses: list[str]) -> dict[str, Any]:
         """
         For a list of tokens fetches their prices
         via multi-price API ensuring each token has a price
@@ -52,7 +76,8 @@ class BirdEyeClient:
             token_addresses (list[str]): A list of tokens for which to fetch prices
 
         Returns:
-           dict[str, dict[str, PriceInfo[Decimal, Decimal]]: Mapping of token to a named tuple PriceInfo with price and liquidity
+           dict[str, Any]: Response with "success" and a mapping of token to its read-only price entry under "data",
+           the same shape whether prices were fetched or served from cache
 
         Raises:
             NoPositionsError: Raise if no tokens are provided
@@ -62,19 +87,56 @@ class BirdEyeClient:
         if not token_addresses:
             raise NoPositionsError("No tokens provided for fetching prices")
 
-        query_url = f"{Config.BIRD_EYE_URL}/multi_price"
+        # Duplicates are looked up and fetched once
+        unique = list(dict.fromkeys(token_addresses))
+        prices, misses = partition_cached(self._price_cache, self._cache_lock, unique)
+
+        if misses:
+            # Entries are frozen once here so hits can be returned without copying
+            fetched = {}
+            for response in fan_out(
+                self._fetch_prices_chunk, chunked(misses, _BIRDEYE_MAX)
+            ):
+                for address, price in response["data"].items():
+                    fetched[address] = freeze(price)
+
+            with self._cache_lock:
+                self._price_cache.update(fetched)
+            prices.update(fetched)
+
+        # Every chunk was checked for success, so a cached result is one too
+        return {"success": True, "data": prices}
+
+    def _fetch_prices_chunk(self, token_addresses: list[str]) -> dict:
+        """
+        Fetches prices for a chunk of at most _BIRDEYE_MAX tokens
+        via a single multi-price API call
+
+        Args:
+            token_addresses (list[str]): A chunk of tokens for which to fetch prices
+
+        Returns:
+            dict: JSON response from API
+
+        Raises:
+            InvalidToken: Raised if the API call or its reported success failed
+        """
+
         resp = self._make_api_call(
             "GET",
-            query_url,
+            self._MULTI_PRICE_URL,
             params={"list_address": ",".join(token_addresses)},
         )
         if resp.status_code != 200:
             raise InvalidTokens(InvalidTokens.message)
 
-        prices = resp.json()
-        return prices
+        response = orjson.loads(resp.content)
+        if not response.get("success") or not isinstance(response.get("data"), dict):
+            raise InvalidTokens(token_addresses)
+
+        return response
 
-    def fetch_token_overview(self, address: str) -> TokenOverview:
+    def fetch_token_overview(self, address: str) -> Mapping[str, Any]:
         """
         For a token fetches their overview
         via multi-price API ensuring each token has a price
@@ -83,7 +145,7 @@ class BirdEyeClient:
             address (str): A token address for which to fetch overview
 
         Returns:
-            dict[str, float | str]: Overview with a lot of token information I don't understand
+            Mapping[str, Any]: Read-only overview with a lot of token information I don't understand
 
         Raises:
             InvalidSolanaAddress: Raise if invalid solana address is passed
@@ -95,19 +157,77 @@ class BirdEyeClient:
         if not is_valid_solana_address:
             raise InvalidSolanaAddress("Invalid Solana address provided")
 
-        query_url = f"{Config.BIRD_EYE_URL}/token_overview"
+        with self._cache_lock:
+            overview = self._overview_cache.get(address)
+        if overview is not None:
+            return overview
+
         resp = self._make_api_call(
             "GET",
-            query_url,
+            self._TOKEN_OVERVIEW_URL,
             params={"address": address},
         )
 
         if resp.status_code != 200:
             raise InvalidTokens(InvalidTokens.message)
 
-        overview = resp.json()
+        overview = orjson.loads(resp.content)
+        if not overview.get("success"):
+            raise InvalidTokens([address])
+
+        overview = freeze(overview)
+        with self._cache_lock:
+            self._overview_cache[address] = overview
         return overview
 
+    def fetch_token_overviews(
+        self, addresses: list[str]
+    ) -> dict[str, Mapping[str, Any]]:
+        """
+        For a list of tokens fetches their overviews
+        concurrently over the shared session
+
+        Args:
+            addresses (list[str]): Token addresses for which to fetch overviews
+
+        Returns:
+            dict[str, Mapping[str, Any]]: Mapping of token to its read-only overview response
+
+        Raises:
+            NoPositionsError: Raise if no tokens are provided
+            InvalidSolanaAddress: Raise if any invalid solana address is passed
+            InvalidToken: Raised if any API call was unsuccessful
+        """
+
+        if not addresses:
+            raise NoPositionsError("No tokens provided for fetching overviews")
+
+        unique = list(dict.fromkeys(addresses))
+        validate_solana_addresses(unique)
+
+        overviews = fan_out(self.fetch_token_overview, unique)
+        return dict(zip(unique, overviews))
+
+
+_birdeye_client: BirdEyeClient | None = None
+_birdeye_client_lock = Lock()
+
+
+def get_birdeye_client() -> BirdEyeClient:
+    """
+    Returns the process wide BirdEyeClient, creating it on first use
+    so its session and connection pool are reused across callers
+
+    Returns:
+        BirdEyeClient: Shared client instance
+    """
+    global _birdeye_client
+    if _birdeye_client is None:
+        with _birdeye_client_lock:
+            if _birdeye_client is None:
+                _birdeye_client = BirdEyeClient()
+    return _birdeye_client
+
 
 # TODO: Uncomment this block to test the BirdEyeClient
 # if __name__ == "__main__":
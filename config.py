@@ -1,10 +1,21 @@
 import os
+from dataclasses import dataclass
 
 import dotenv
 
 dotenv.load_dotenv()
 
 
-class Config:
-    BIRD_EYE_TOKEN = os.environ.get("BIRD_EYE_TOKEN")
-    BIRD_EYE_URL = "https://public-api.birdeye.so/defi"
+@dataclass(frozen=True, slots=True)
+class _Config:
+    # Only BirdEyeClient needs the token, so it validates presence itself
+    BIRD_EYE_TOKEN: str | None
+    BIRD_EYE_URL: str = "https://public-api.birdeye.so/defi"
+    # Seconds a fetched price or overview is served from memory
+    PRICE_TTL: int = 10
+
+
+Config = _Config(
+    BIRD_EYE_TOKEN=os.environ.get("BIRD_EYE_TOKEN"),
+    PRICE_TTL=int(os.environ.get("PRICE_TTL", 10)),
+)
@@ -2,22 +2,60 @@
 Client for DexScreener APIs
 """
 
+from array import array
 from decimal import Decimal
+from functools import lru_cache
+from threading import Lock
 from typing import Any
 
+import orjson
 import requests
+from cachetools import TTLCache
 
 from common import PriceInfo, TokenOverview
+from config import Config
 from custom_exceptions import InvalidSolanaAddress, InvalidTokens, NoPositionsError
-from utils.helpers import is_solana_address
-from vars.constants import SOL_MINT
+from utils.helpers import (
+    chunked,
+    fan_out,
+    is_solana_address,
+    partition_cached,
+    validate_solana_addresses,
+)
+from utils.http import build_session
+from vars.constants import REQUEST_TIMEOUT, SOL_MINT
+
+# Maximum number of addresses accepted by a single tokens call
+_CHUNK = 30
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: str | float) -> Decimal:
+    # Prices and liquidities recur across responses, so reuse their Decimals.
+    # Values go through str so JSON floats don't leak binary noise into them
+    return Decimal(str(value))
 
 
 class DexScreenerClient:
     """
     Handler class to assist with all calls to DexScreener API
+
+    Use get_dex_client() to share one instance per process, constructing
+    the client directly creates a new connection pool every time
     """
 
+    # TODO: Check and Update for the valid API endpoint of DexScreener
+    _TOKENS_URL = "https://api.dexscreener.com/latest/dex/tokens/"
+
+    def __init__(self):
+        self._session = build_session()
+
+        self._cache_lock = Lock()
+        self._price_cache = TTLCache(maxsize=4096, ttl=Config.PRICE_TTL)
+        # Float prices are cached apart so the float paths never build Decimals
+        self._float_price_cache = TTLCache(maxsize=4096, ttl=Config.PRICE_TTL)
+        self._overview_cache = TTLCache(maxsize=4096, ttl=Config.PRICE_TTL)
+
     @staticmethod
     def _validate_token_address(token_address: str):
         """
@@ -39,7 +77,7 @@ class DexScreenerClient:
         is_valid = is_solana_address(token_address)
 
         if not is_valid:
-            raise InvalidSolanaAddress()
+            raise InvalidSolanaAddress(token_address)
 
     def _validate_token_addresses(self, token_addresses: list[str]):
         """
@@ -55,11 +93,7 @@ class DexScreenerClient:
             NoPositionsError: If token addresses are empty
             InvalidSolanaAddress: If any token address is not a valid solana address
         """
-        if not token_addresses:
-            raise NoPositionsError()
-
-        for token_address in token_addresses:
-            self._validate_token_address(token_address)
+        validate_solana_addresses(token_addresses)
 
     @staticmethod
     def _validate_response(resp: requests.Response):
@@ -95,13 +129,13 @@ class DexScreenerClient:
         """
         self._validate_token_address(token_address)
 
-        # TODO: Check and Update for the valid API endpoint of DexScreener
-        res = requests.get(
-            f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+        res = self._session.get(
+            self._TOKENS_URL + token_address,
+            timeout=REQUEST_TIMEOUT,
         )
         self._validate_response(res)
 
-        return res.json()
+        return orjson.loads(res.content)
 
     def _call_api_bulk(self, token_addresses: list[str]) -> dict[str, Any]:
         """
@@ -120,12 +154,33 @@ class DexScreenerClient:
         """
         self._validate_token_addresses(token_addresses)
 
-        res = requests.get(
-            f"https://api.dexscreener.com/latest/dex/tokens/{','.join(token_addresses)}"
+        res = self._session.get(
+            self._TOKENS_URL + ",".join(token_addresses),
+            timeout=REQUEST_TIMEOUT,
         )
         self._validate_response(res)
 
-        return res.json()
+        return orjson.loads(res.content)
+
+    def _call_api_chunked(self, token_addresses: list[str]) -> dict[str, Any]:
+        """
+        Calls DexScreener API for any number of tokens,
+        in concurrent chunks of at most _CHUNK tokens
+
+        Args:
+            token_addresses (list[str]): Token addresses for which to fetch data
+
+        Returns:
+            dict[str, Any]: Merged JSON responses from API
+
+        Raises:
+            InvalidTokens: If any response is not 200
+        """
+        res = {}
+        for chunk_res in fan_out(self._call_api_bulk, chunked(token_addresses, _CHUNK)):
+            res.update(chunk_res)
+
+        return res
 
     def fetch_prices_dex(
         self, token_addresses: list[str]
@@ -141,16 +196,113 @@ class DexScreenerClient:
            dict[str, dict[Decimal, PriceInfo[str, Decimal]]: Mapping of token to a named tuple PriceInfo with price and liquidity in Decimal
 
         """
-        res = self._call_api_bulk(token_addresses)
+        # Duplicates are validated and fetched once, then fanned back out below
+        unique = list(dict.fromkeys(token_addresses))
+        self._validate_token_addresses(unique)
+
+        prices, misses = partition_cached(self._price_cache, self._cache_lock, unique)
+        if misses:
+            res = self._call_api_chunked(misses)
+
+            # Local aliases skip global lookups inside the comprehension
+            D = _to_decimal
+            PI = PriceInfo
+            fetched = {
+                token_address: PI(D(data["price"]), D(data["liquidity"]))
+                for token_address, data in res.items()
+            }
+
+            with self._cache_lock:
+                self._price_cache.update(fetched)
+            prices.update(fetched)
+
+        return {
+            address: prices[address] for address in token_addresses if address in prices
+        }
+
+    def fetch_prices_float(
+        self, token_addresses: list[str]
+    ) -> dict[str, PriceInfo[float, float]]:
+        """
+        For a list of tokens fetches their prices as floats
+        read straight from the JSON, skipping Decimal construction
+
+        Args:
+            token_addresses (list[str]): A list of tokens for which to fetch prices
+
+        Returns:
+           dict[str, PriceInfo[float, float]]: Mapping of token to a named tuple PriceInfo with price and liquidity in float
+
+        """
+        unique = list(dict.fromkeys(token_addresses))
+        self._validate_token_addresses(unique)
+
+        prices, misses = partition_cached(
+            self._float_price_cache, self._cache_lock, unique
+        )
+        if misses:
+            res = self._call_api_chunked(misses)
+
+            PI = PriceInfo
+            fetched = {
+                token_address: PI(float(data["price"]), float(data["liquidity"]))
+                for token_address, data in res.items()
+            }
 
-        prices = {}
-        for token_address, data in res.items():
-            prices[token_address] = PriceInfo(
-                Decimal(data["price"]),
-                Decimal(data["liquidity"]),
-            )
+            with self._cache_lock:
+                self._float_price_cache.update(fetched)
+            prices.update(fetched)
 
-        return prices
+        return {
+            address: prices[address] for address in token_addresses if address in prices
+        }
+
+    def fetch_prices_columns(
+        self, token_addresses: list[str]
+    ) -> tuple[list[str], array, array]:
+        """
+        For a list of tokens fetches their prices as parallel columns,
+        one compact float64 array per field filled straight from the JSON,
+        sharing the float price cache with fetch_prices_float
+
+        Args:
+            token_addresses (list[str]): A list of tokens for which to fetch prices
+
+        Returns:
+           tuple[list[str], array, array]: Token addresses with their prices and liquidities at the same index
+
+        """
+        unique = list(dict.fromkeys(token_addresses))
+        self._validate_token_addresses(unique)
+
+        cached, misses = partition_cached(
+            self._float_price_cache, self._cache_lock, unique
+        )
+        res = self._call_api_chunked(misses) if misses else {}
+
+        # Single pass in caller order, hits from cache and misses from the JSON
+        addresses = [
+            address for address in unique if address in cached or address in res
+        ]
+        n = len(addresses)
+        prices = array("d", [0.0]) * n
+        liquidities = array("d", [0.0]) * n
+        fetched = {}
+        for i, address in enumerate(addresses):
+            price = cached.get(address)
+            if price is None:
+                data = res[address]
+                prices[i] = float(data["price"])
+                liquidities[i] = float(data["liquidity"])
+                fetched[address] = PriceInfo(prices[i], liquidities[i])
+            else:
+                prices[i], liquidities[i] = price
+
+        if fetched:
+            with self._cache_lock:
+                self._float_price_cache.update(fetched)
+
+        return addresses, prices, liquidities
 
     def fetch_token_overview(self, address: str) -> TokenOverview:
         """
@@ -164,33 +316,78 @@ class DexScreenerClient:
         TokenOverview: Overview with a lot of token information I don't understand
         """
 
+        with self._cache_lock:
+            overview = self._overview_cache.get(address)
+        if overview is not None:
+            return overview
+
         res = self._call_api(address)
 
-        return TokenOverview(
-            price=Decimal(res["price"]),
+        overview = TokenOverview(
+            price=_to_decimal(res["price"]),
             symbol=res["symbol"],
             decimals=res["decimals"],
             lastTradeUnixTime=res["lastTradeUnixTime"],
-            liquidity=Decimal(res["liquidity"]),
-            supply=Decimal(res["supply"]),
+            liquidity=_to_decimal(res["liquidity"]),
+            supply=_to_decimal(res["supply"]),
         )
+        with self._cache_lock:
+            self._overview_cache[address] = overview
+        return overview
+
+    def fetch_token_overviews(self, addresses: list[str]) -> dict[str, TokenOverview]:
+        """
+        For a list of tokens fetches their overviews
+        concurrently over the shared session
+
+        Args:
+        addresses (list[str]): Token addresses for which to fetch overviews
+
+        Returns:
+        dict[str, TokenOverview]: Mapping of token to its overview
+        """
+
+        unique = list(dict.fromkeys(addresses))
+        self._validate_token_addresses(unique)
+
+        overviews = fan_out(self.fetch_token_overview, unique)
+        return dict(zip(unique, overviews))
 
     @staticmethod
     def find_largest_pool_with_sol(token_pairs, address):
-        max_entry = {}
-        max_liquidity_usd = -1
-
-        for entry in token_pairs:
-            # Check if the baseToken address matches the specified address
-            if (
-                entry.get("baseToken", {}).get("address") == address
-                and entry["quoteToken"]["address"] == SOL_MINT
-            ):
-                liquidity_usd = float(entry.get("liquidity", {}).get("usd", 0))
-                if liquidity_usd > max_liquidity_usd:
-                    max_liquidity_usd = liquidity_usd
-                    max_entry = entry
-        return max_entry
+        sol = SOL_MINT
+        # Single pass: filter pairs of the token quoted in SOL, keep the deepest pool
+        return max(
+            (
+                entry
+                for entry in token_pairs
+                if entry.get("baseToken", {}).get("address") == address
+                and entry["quoteToken"]["address"] == sol
+            ),
+            key=lambda entry: float(entry.get("liquidity", {}).get("usd") or 0),
+            default={},
+        )
+
+
+_dex_client: DexScreenerClient | None = None
+_dex_client_lock = Lock()
+
+
+def get_dex_client() -> DexScreenerClient:
+    """
+    Returns the process wide DexScreenerClient, creating it on first use
+    so its session and connection pool are reused across callers
+
+    Returns:
+        DexScreenerClient: Shared client instance
+    """
+    global _dex_client
+    if _dex_client is None:
+        with _dex_client_lock:
+            if _dex_client is None:
+                _dex_client = DexScreenerClient()
+    return _dex_client
+
 
 # TODO: Uncomment the code below to test the DexScreenerClient
 # if __name__ == "__main__":
@@ -5,12 +5,154 @@
 #     except ValueError:
 #         return False
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, MutableMapping, Sequence, TypeVar
+
 import base58
 
+from custom_exceptions import InvalidSolanaAddress, NoPositionsError
+from vars.constants import MAX_CONCURRENT_REQUESTS
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Distinguishes a cache miss from a cached None, e.g. a token BirdEye can't price
+_MISSING = object()
+
+
+# Solana public keys are 32 bytes, i.e. 32 to 44 characters of base58
+_B58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
 
 def is_solana_address(address: str) -> bool:
+    if (
+        not isinstance(address, str)
+        or not 32 <= len(address) <= 44
+        or not address.isascii()
+    ):
+        return False
+
+    # Deleting every alphabet byte leaves nothing behind for valid base58
+    if address.encode().translate(None, _B58_ALPHABET):
+        return False
+
+    return _decodes_to_pubkey(address)
+
+
+@lru_cache(maxsize=8192)
+def _decodes_to_pubkey(address: str) -> bool:
+    # Addresses recur across validators and bulk calls, so memoize the decode
     try:
         decoded = base58.b58decode(address)
         return len(decoded) == 32
     except Exception:
         return False
+
+
+def validate_solana_addresses(addresses: Sequence[str]):
+    """
+    Validates addresses to be valid solana addresses,
+    checking all of them before any request is issued
+
+    Args:
+        addresses (Sequence[str]): Addresses to validate
+
+    Returns:
+        None: If addresses are valid
+
+    Raises:
+        NoPositionsError: If addresses are empty
+        InvalidSolanaAddress: If any address is not a valid solana address
+    """
+    if not addresses:
+        raise NoPositionsError()
+
+    for address in addresses:
+        if not is_solana_address(address):
+            raise InvalidSolanaAddress(address)
+
+
+def fan_out(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> list[R]:
+    """
+    Runs an I/O bound function over items concurrently, preserving order
+
+    Args:
+        func (Callable[[T], R]): Function to call for every item
+        items (Iterable[T]): Items to process
+        max_workers (int): Maximum number of concurrent calls
+
+    Returns:
+        list[R]: Results in the same order as the items
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Splits a sequence into consecutive chunks of at most size items
+
+    Args:
+        items (Sequence[T]): Items to split
+        size (int): Maximum number of items per chunk
+
+    Returns:
+        Iterator[Sequence[T]]: Consecutive chunks of the items
+    """
+    return (items[i : i + size] for i in range(0, len(items), size))
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively makes parsed JSON read-only so it can be cached
+    and handed to every caller without copying
+
+    Args:
+        value (Any): Parsed JSON value
+
+    Returns:
+        Any: Same value with dicts as MappingProxyType and lists as tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def partition_cached(
+    cache: MutableMapping[str, R], lock: Lock, keys: Iterable[str]
+) -> tuple[dict[str, R], list[str]]:
+    """
+    Splits keys into those already present in the cache and those missing,
+    a cached None counts as present
+
+    Args:
+        cache (MutableMapping[str, R]): Cache to look keys up in
+        lock (Lock): Lock guarding the cache
+        keys (Iterable[str]): Keys to look up
+
+    Returns:
+        tuple[dict[str, R], list[str]]: Cached values by key and the missing keys
+    """
+    hits = {}
+    misses = []
+    with lock:
+        for key in keys:
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                misses.append(key)
+            else:
+                hits[key] = value
+    return hits, misses
@@ -0,0 +1,42 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from vars.constants import MAX_CONCURRENT_REQUESTS
+
+
+def build_session(headers: dict[str, str] | None = None) -> requests.Session:
+    """
+    Builds a session with a pooled, retrying HTTPS adapter
+    so connections are kept alive and reused across calls
+
+    Args:
+        headers (dict[str, str] | None): Extra headers sent with every request
+
+    Returns:
+        requests.Session: Session ready to be shared by a client
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            # Transient failures are retried on the same pooled connection;
+            # once retries run out the last response is returned so callers
+            # still raise InvalidTokens on its status
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.25,
+                backoff_jitter=0.1,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    session.headers["accept"] = "application/json"
+    if headers:
+        session.headers.update(headers)
+    return session
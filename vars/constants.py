@@ -1 +1,7 @@
 SOL_MINT = "So11111111111111111111111111111111111111112"
+
+# Upper bound on in-flight HTTP requests, matches the session pool size
+MAX_CONCURRENT_REQUESTS = 20
+
+# (connect, read) seconds, bounds each attempt so a stalled socket cannot hang a worker
+REQUEST_TIMEOUT = (3, 10)